@@ -1,12 +1,9 @@
 from __future__ import annotations
 
-import enum
 import logging
 import os
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Mapping
-
-from configparser_override.exceptions import SectionNotFound
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Mapping
 
 if TYPE_CHECKING:
     import configparser
@@ -28,6 +25,19 @@ def _lowercase_optionxform(optionstr: str) -> str:
     return optionstr.lower()
 
 
+def _unchanged(name: str) -> str:
+    """
+    Return the given name as is, used as case transform for case sensitive
+    overrides.
+
+    :param name: The name.
+    :type name: str
+    :return: The same name.
+    :rtype: str
+    """
+    return name
+
+
 class Strategy(ABC):
     def __init__(
         self,
@@ -56,68 +66,69 @@ class Strategy(ABC):
         self._env_prefix = env_prefix
         self._overrides = overrides
         self.case_sensitive_overrides = case_sensitive_overrides
+        # Case handling is fixed for the lifetime of the strategy, pick the
+        # transforms once instead of branching on it per section and option
+        self._section_lookup_key: Callable[[str], str]
+        self._env_name_case: Callable[[str], str]
+        if case_sensitive_overrides:
+            self._section_lookup_key = _unchanged
+            self._env_name_case = _unchanged
+        else:
+            self._section_lookup_key = str.lower
+            self._env_name_case = str.upper
+        self._default_section_lower = config.default_section.lower()
         if optionxform_fn is None:
             self.optionxform_fn = _lowercase_optionxform
         else:
             self.optionxform_fn = optionxform_fn
+        # The overrides are fixed for the lifetime of the strategy, split the
+        # keys into section and option once
+        self._parsed_overrides = self._parse_items(overrides.items())
 
     @abstractmethod
     def execute(self):
         """Execute the strategy. Must be implemented by subclasses."""
         pass
 
-    def collect_env_vars_with_prefix(self, prefix: str) -> dict[str, str]:
+    def collect_env_vars_with_prefix(
+        self, prefix: str, environ: Mapping[str, str] | None = None
+    ) -> dict[str, str]:
         """
         Collect environment variables that start with the given prefix.
 
         :param prefix: The prefix to filter environment variables.
         :type prefix: str
+        :param environ: Optional snapshot of the environment to filter, defaults
+            to :py:data:`os.environ`.
+        :type environ: Mapping[str, str] | None, optional
         :return: Dictionary of environment variables with the prefix removed.
         :rtype: dict[str, str]
         """
-        if self.case_sensitive_overrides:
-            return {
-                key[len(prefix) :]: value
-                for key, value in os.environ.items()
-                if key.startswith(prefix)
-            }
-        return {
-            key[len(prefix) :]: value
-            for key, value in os.environ.items()
-            if key.startswith(prefix.upper())
-        }
+        return dict(self._iter_env_vars_with_prefix(prefix, environ))
 
-    def decide_env_var(self, prefix: str, section: str, option: str) -> str:
+    def _iter_env_vars_with_prefix(
+        self, prefix: str, environ: Mapping[str, str] | None = None
+    ) -> Iterator[tuple[str, str]]:
         """
-        Determine the appropriate environment variable name based on the given
-        prefix, section, and option.
+        Lazily yield environment variables that start with the given prefix.
 
-        :param prefix: The prefix for environment variables.
+        :param prefix: The prefix to filter environment variables.
         :type prefix: str
-        :param section: The section in the configuration.
-        :type section: str
-        :param option: The option in the configuration.
-        :type option: str
-        :return: The environment variable name.
-        :rtype: str
-
-        .. note::
-            This method is aware of case-sensitivity setting
-
+        :param environ: Optional snapshot of the environment to filter, defaults
+            to :py:data:`os.environ`.
+        :type environ: Mapping[str, str] | None, optional
+        :return: Iterator of environment variable names, with the prefix
+            removed, and values.
+        :rtype: Iterator[tuple[str, str]]
         """
-        if self.case_sensitive_overrides:
-            env_var = (
-                f"{prefix}{section}__{option}"
-                if section != self._config.default_section
-                else f"{prefix}{option}"
-            )
-        else:
-            env_var = (
-                f"{prefix.upper()}{section.upper()}__{option.upper()}"
-                if section.lower() != self._config.default_section.lower()
-                else f"{prefix.upper()}{option.upper()}"
-            )
-        return env_var
+        if environ is None:
+            environ = os.environ
+        prefix = self._env_name_case(prefix)
+        prefix_len = len(prefix)
+        _startswith = str.startswith
+        for key, value in environ.items():
+            if _startswith(key, prefix):
+                yield key[prefix_len:], value
 
     def parse_key(self, key: str) -> tuple[str, str]:
         """
@@ -131,64 +142,111 @@ class Strategy(ABC):
         :return: A tuple containing the section and option.
         :rtype: tuple[str, str]
         """
-        parts = key.split("__", 1)
-        if len(parts) == 1:
-            return self._config.default_section, self.optionxform_fn(parts[0])
-        return parts[0], self.optionxform_fn(parts[1])
+        separator = key.find("__")
+        if separator < 0:
+            return self._config.default_section, self.optionxform_fn(key)
+        return key[:separator], self.optionxform_fn(key[separator + 2 :])
+
+    def _parse_items(
+        self, items: Iterable[tuple[str, str]]
+    ) -> list[tuple[str, str, str]]:
+        """
+        Parse every key of the key-value pairs into section and option, as
+        :meth:`parse_key` does for a single key.
 
-    def has_section(self, section: str) -> bool:
+        :param items: Override keys and values.
+        :type items: Iterable[tuple[str, str]]
+        :return: List of section, option and value tuples.
+        :rtype: list[tuple[str, str, str]]
         """
-        Check if the section exists or is the default section.
+        parse_key = self.parse_key
+        return [(*parse_key(key), value) for key, value in items]
 
-        :param section: The section name to check.
-        :type section: str
-        :return: True if the section exists, False otherwise.
-        :rtype: bool
+    def _section_map(self) -> dict[str, str]:
+        """
+        Map the name of every section, including the default section, to the
+        existing section name.
 
-        .. note::
-            This method is aware of case-sensitivity setting
+        Unless case sensitive, the map is keyed on lowercase names. If several
+        sections then only differ by case the first one wins, and the default
+        section wins over all of them.
 
+        :return: Dictionary of section lookup names to existing names.
+        :rtype: dict[str, str]
         """
-        if self.case_sensitive_overrides:
-            return (
-                self._config.has_section(section)
-                or section == self._config.default_section
-            )
-        return (
-            section.lower() in (sect.lower() for sect in self._config.sections())
-            or section.lower() == self._config.default_section.lower()
-        )
+        section_lookup_key = self._section_lookup_key
+        _default_section = self._config.default_section
+        section_map = {
+            section_lookup_key(sect): sect for sect in reversed(self._config.sections())
+        }
+        section_map[section_lookup_key(_default_section)] = _default_section
+        return section_map
 
-    def get_existing_section_case_insensitive(self, section: str) -> str:
+    def _set_creating(
+        self, section: str, option: str, value: str, section_map: dict[str, str]
+    ):
         """
-        Get the existing section name in a case-insensitive manner.
+        Set an option, adding its section first if it does not exist.
 
-        :param section: The section name to search for.
+        :param section: The section name, in any case unless case sensitive.
         :type section: str
-        :return: The actual section name in the configuration.
-        :rtype: str
-        :raises SectionNotFound: If section is not found.
+        :param option: The option name.
+        :type option: str
+        :param value: The value to set.
+        :type value: str
+        :param section_map: Mapping from :meth:`_section_map`, updated when a
+            section is added.
+        :type section_map: dict[str, str]
         """
-        if section.lower() == self._config.default_section.lower():
-            return self._config.default_section
-        for sect in self._config.sections():
-            if sect.lower() == section.lower():
-                return sect
-        raise SectionNotFound(f"Section {section} not found.")
-
-    def override_and_add_new(self, key: str, value: str):
-        section, option = self.parse_key(key)
-        if self.case_sensitive_overrides:
-            if not self.has_section(section):
-                self._config.add_section(section=section)
-            self._config.set(section=section, option=option, value=value)
-        else:
-            if not self.has_section(section):
-                self._config.add_section(section=section.lower())
-                self._config.set(section=section.lower(), option=option, value=value)
+        config = self._config
+        key = self._section_lookup_key(section)
+        _section = section_map.get(key)
+        if _section is None:
+            config.add_section(section=key)
+            _section = section_map[key] = key
+        config.set(section=_section, option=option, value=value)
+
+    def _iter_option_env_names(self) -> Iterator[tuple[str, str, str]]:
+        """
+        Iterate over all existing options together with the name of the
+        environment variable, without prefix, that overrides them.
+
+        Options inherited from the default section are yielded for every
+        section as well, as when iterating ``self._config[section]``.
+
+        :return: Iterator of section, option and environment variable name.
+        :rtype: Iterator[tuple[str, str, str]]
+
+        .. note::
+            This method is aware of case-sensitivity setting
+
+        """
+        # Resolve the casing of each section and default option once, so only
+        # the section-local option part of a name is built per option. The
+        # parser's own dicts (private API of RawConfigParser) are walked rather
+        # than building a SectionProxy and a merged option list per section
+        case_sensitive = self.case_sensitive_overrides
+        _env_name_case = self._env_name_case
+        _default_section = self._config.default_section
+        _sections = self._config._sections  # type: ignore[attr-defined]
+        _defaults = self._config._defaults  # type: ignore[attr-defined]
+        default_keys = {option: _env_name_case(option) for option in _defaults}
+        for section, options in _sections.items():
+            if not case_sensitive and section.lower() == self._default_section_lower:
+                section_prefix = ""
             else:
-                _section = self.get_existing_section_case_insensitive(section)
-                self._config.set(section=_section, option=option, value=value)
+                section_prefix = f"{_env_name_case(section)}__"
+            for option in options:
+                yield section, option, section_prefix + _env_name_case(option)
+            for option, option_key in default_keys.items():
+                if option not in options:
+                    yield section, option, section_prefix + option_key
+        for option, option_key in default_keys.items():
+            yield _default_section, option, option_key
+
+    def _set_existing_option(self, section: str, option: str, value: str, source: str):
+        logger.debug("Override section=%r, option=%r with %s", section, option, source)
+        self._config.set(section=section, option=option, value=value)
 
     def override_env(self, create_new_options: bool):
         """
@@ -197,40 +255,42 @@ class Strategy(ABC):
         :param create_new_options: Flag to indicate if new options can be created.
         :type create_new_options: bool
         """
+        if create_new_options and self._env_prefix == "":
+            # Without a prefix every env var would become a new option
+            return
         if create_new_options:
-            env_vars = (
-                self.collect_env_vars_with_prefix(self._env_prefix)
-                if self._env_prefix != ""
-                else {}
+            # Only the matching env vars are kept, as parsed section and option
+            parsed_env_vars = self._parse_items(
+                self._iter_env_vars_with_prefix(self._env_prefix)
             )
-            for key, value in env_vars.items():
-                self.override_and_add_new(key=key, value=value)
-        else:
-            for section in self._config.sections():
-                for option in self._config[section]:
-                    env_var = self.decide_env_var(self._env_prefix, section, option)
-                    if env_var in os.environ:
-                        _value = os.environ[env_var]
-                        logger.debug(f"Override {section=}, {option=} with {env_var}")
-                        self._config.set(section=section, option=option, value=_value)
-                    else:
-                        logger.debug(f"Environment variable {env_var} not set")
-
-            _default_section = self._config.default_section
-            for option in self._config.defaults():
-                env_var = self.decide_env_var(
-                    self._env_prefix, _default_section, option
-                )
-                if env_var in os.environ:
-                    _value = os.environ[env_var]
-                    logger.debug(
-                        f"Override section={_default_section}, {option=} with {env_var}"
-                    )
-                    self._config.set(
-                        section=_default_section, option=option, value=_value
-                    )
-                else:
-                    logger.debug(f"Environment variable {env_var} not set")
+            if not parsed_env_vars:
+                return
+            section_map = self._section_map()
+            _set_creating = self._set_creating
+            for section, option, value in parsed_env_vars:
+                _set_creating(section, option, value, section_map)
+            return
+
+        # Filter a single snapshot of the environment on the prefix, the
+        # existing options are then only matched against the (usually few)
+        # matching vars
+        env_vars = self.collect_env_vars_with_prefix(self._env_prefix)
+        if env_vars:
+            self._override_existing_from_env(env_vars)
+
+    def _override_existing_from_env(self, env_vars: Mapping[str, str]):
+        """
+        Override existing options with the matching environment variables.
+
+        :param env_vars: Environment variables with the prefix removed.
+        :type env_vars: Mapping[str, str]
+        """
+        prefix = self._env_name_case(self._env_prefix)
+        # Bound once, since the loop runs for every existing option
+        _set_existing_option = self._set_existing_option
+        for section, option, key in self._iter_option_env_names():
+            if key in env_vars:
+                _set_existing_option(section, option, env_vars[key], f"{prefix}{key}")
 
     def override_direct(self, create_new_options: bool):
         """
@@ -239,39 +299,89 @@ class Strategy(ABC):
         :param create_new_options: Flag to indicate if new options can be created.
         :type create_new_options: bool
         """
+        if not self._parsed_overrides:
+            return
+        # Resolve sections through one map per call rather than scanning all
+        # sections for every override
+        section_map = self._section_map()
         if create_new_options:
-            for key, value in self._overrides.items():
-                self.override_and_add_new(key=key, value=value)
+            _set_creating = self._set_creating
+            for section, option, value in self._parsed_overrides:
+                _set_creating(section, option, value, section_map)
+            return
+
+        # Probe the parser's own section and default dicts directly, which is
+        # what has_section/has_option end up doing after re-validating input
+        _sections = self._config._sections  # type: ignore[attr-defined]
+        _defaults = self._config._defaults  # type: ignore[attr-defined]
+        _optionxform = self._config.optionxform
+        _default_section = self._config.default_section
+        _section_lookup_key = self._section_lookup_key
+        _set_existing_option = self._set_existing_option
+        for section, option, value in self._parsed_overrides:
+            _section = section_map.get(_section_lookup_key(section))
+            option_key = _optionxform(option)
+            if _section is not None and (
+                option_key in _defaults
+                or (_section != _default_section and option_key in _sections[_section])
+            ):
+                _set_existing_option(_section, option, value, "direct assignment")
+            else:
+                logger.debug(
+                    "New direct assignment section=%r option=%r ignored",
+                    section,
+                    option,
+                )
 
-        else:
-            for key, value in self._overrides.items():
-                section, option = self.parse_key(key)
-                if self.case_sensitive_overrides:
-                    if self.has_section(section) and self._config.has_option(
-                        section, option
-                    ):
-                        logger.debug(
-                            f"Override {section=}, {option=} with direct assignment"
-                        )
-                        self._config.set(section=section, option=option, value=value)
-                    else:
-                        logger.debug(
-                            f"New direct assignment {section=} {option=} ignored"
-                        )
-                else:
-                    if self.has_section(section):
-                        section = self.get_existing_section_case_insensitive(section)
-                        if self._config.has_option(section, option):
-                            logger.debug(
-                                f"Override {section=}, {option=} with direct assignment"
-                            )
-                            self._config.set(
-                                section=section, option=option, value=value
-                            )
-                        else:
-                            logger.debug(
-                                f"New direct assignment {section=} {option=} ignored"
-                            )
+    def override_env_and_direct_existing(self):
+        """
+        Override existing configuration values using environment variables and
+        direct overrides in a single pass over the options.
+
+        Equivalent to :meth:`override_env` followed by :meth:`override_direct`
+        without creating new options, where direct overrides take precedence
+        over environment variables.
+        """
+        # Only fuse when both sources have something to apply, otherwise the
+        # single source methods do less work
+        env_vars = self.collect_env_vars_with_prefix(self._env_prefix)
+        if not env_vars or not self._parsed_overrides:
+            if env_vars:
+                self._override_existing_from_env(env_vars)
+            self.override_direct(create_new_options=False)
+            return
+
+        # Key the direct overrides on the existing section and the option as
+        # stored by the parser, to match the options walked below
+        section_map = self._section_map()
+        _optionxform = self._config.optionxform
+        _section_lookup_key = self._section_lookup_key
+        direct: dict[tuple[str, str], tuple[str, str, str]] = {}
+        for section, option, value in self._parsed_overrides:
+            _section = section_map.get(_section_lookup_key(section))
+            if _section is None:
+                logger.debug(
+                    "New direct assignment section=%r option=%r ignored",
+                    section,
+                    option,
+                )
+            else:
+                direct[(_section, _optionxform(option))] = (section, option, value)
+
+        prefix = self._env_name_case(self._env_prefix)
+        _set_existing_option = self._set_existing_option
+        for section, option, key in self._iter_option_env_names():
+            direct_override = direct.pop((section, option), None)
+            if direct_override is not None:
+                _, direct_option, value = direct_override
+                _set_existing_option(section, direct_option, value, "direct assignment")
+            elif key in env_vars:
+                _set_existing_option(section, option, env_vars[key], f"{prefix}{key}")
+        # Whatever was not walked does not exist in its section
+        for section, option, _ in direct.values():
+            logger.debug(
+                "New direct assignment section=%r option=%r ignored", section, option
+            )
 
 
 class NewOptionsFromEnvStrategy(Strategy):
@@ -294,12 +404,4 @@ class NewOptionsFromDirectAndEnvStrategy(Strategy):
 
 class NoNewOptionsStrategy(Strategy):
     def execute(self):
-        self.override_env(create_new_options=False)
-        self.override_direct(create_new_options=False)
-
-
-class OverrideStrategies(enum.Enum):
-    NEW_OPTIONS_FROM_ENV = NewOptionsFromEnvStrategy
-    NEW_OPTIONS_FROM_DIRECT = NewOptionsFromDirectStrategy
-    NEW_OPTIONS_FROM_DIRECT_AND_ENV = NewOptionsFromDirectAndEnvStrategy
-    NO_NEW_OPTIONS = NoNewOptionsStrategy
+        self.override_env_and_direct_existing()
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import configparser
 import logging
+from configparser import ConfigParser
 from typing import TYPE_CHECKING, Any, Iterable, List, Mapping, Optional, Type
 
-from configparser_override._strategy_factory import StrategyFactory
+from configparser_override._strategy_factory import _build_strategy
 from configparser_override.convert import ConfigConverter
 
 if TYPE_CHECKING:
@@ -22,7 +22,7 @@ class ConfigParserOverride:
         env_prefix: str = "",
         create_new_from_env_prefix: bool = True,
         create_new_from_direct: bool = True,
-        config_parser: configparser.ConfigParser | None = None,
+        config_parser: ConfigParser | None = None,
         case_sensitive_overrides: bool = False,
         optionxform: _optionxform_fn | None = None,
         **overrides: str,
@@ -72,7 +72,7 @@ class ConfigParserOverride:
         # Configure ConfigParser and align optionxform for consistency in later
         # inferance for overrides
         if config_parser is None:
-            self._config = configparser.ConfigParser()
+            self._config = ConfigParser()
             if self.optionxform is not None:
                 self._config.optionxform = self.optionxform  # type: ignore
         else:
@@ -86,7 +86,7 @@ class ConfigParserOverride:
         :return: The appropriate strategy instance.
         :rtype: Strategy
         """
-        return StrategyFactory(
+        return _build_strategy(
             self._config,
             self.env_prefix,
             self.create_new_from_env_prefix,
@@ -94,7 +94,7 @@ class ConfigParserOverride:
             self.overrides,
             self.case_sensitive_overrides,
             self.optionxform,
-        ).get_strategy()
+        )
 
     def apply_overrides(self) -> None:
         """
@@ -114,6 +114,15 @@ class ConfigParserOverride:
             >>> config.get('DEFAULT', 'test_option')
             'value'
         """
+        if (
+            not self.overrides
+            and not self.env_prefix
+            and self.create_new_from_env_prefix
+        ):
+            # Nothing can be overridden: env vars only create new options with
+            # a prefix, and unprefixed env vars only override existing options
+            # when new options from env are disabled
+            return
         strategy = self._get_override_strategy()
         strategy.execute()
 
@@ -235,7 +244,7 @@ class ConfigParserOverride:
         return files_read
 
     @property
-    def config(self) -> configparser.ConfigParser:
+    def config(self) -> ConfigParser:
         """
         Property to access the configuration.
 
@@ -2,13 +2,19 @@ from __future__ import annotations
 
 import ast
 import dataclasses
+import functools
 import logging
+from collections.abc import Iterator
+from collections.abc import Mapping as _MappingABC
+from itertools import repeat
 from pathlib import Path
 from types import UnionType
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
+    Iterable,
     List,
     Mapping,
     Optional,
@@ -36,21 +42,33 @@ from configparser_override.types import SecretBytes, SecretStr
 
 logger = logging.getLogger(__name__)
 
+# Types cast by calling them with the value
+_SCALAR_TYPES = (int, float, complex, str, Path, SecretStr)
+
+# Origins of generic type hints, as returned by get_origin
+_LIST_ORIGINS = frozenset({list, List})
+_DICT_ORIGINS = frozenset({dict, Dict})
+_SET_ORIGINS = frozenset({set, Set})
+_TUPLE_ORIGINS = frozenset({tuple, Tuple})
+_UNION_ORIGINS = frozenset({Optional, Union, UnionType})
+
+# Types whose values are returned as is when they already have the type, the
+# cast would only return an equal value
+_ATOMIC_TYPES = frozenset({int, float, complex, str})
+
 
 def _is_optional_type(type_hint: Any) -> bool:
     """
     Check if a given type hint is an optional type.
     """
-    return get_origin(type_hint) in [Union, UnionType] and type(None) in get_args(
-        type_hint
-    )
+    return get_origin(type_hint) in _UNION_ORIGINS and type(None) in get_args(type_hint)
 
 
 def _is_optional_dataclass(type_hint: Any) -> bool:
     """
     Check if a given type hint is an optional dataclass.
     """
-    if get_origin(type_hint) not in [Union, UnionType]:
+    if get_origin(type_hint) not in _UNION_ORIGINS:
         return False
 
     for arg in get_args(type_hint):
@@ -80,6 +98,66 @@ def _can_ignore_conversion(field: dataclasses.Field) -> bool:
     return _is_optional_type(field.type) or _field_has_default_value(field)
 
 
+@functools.lru_cache(maxsize=256)
+def _resolved_fields(
+    dataclass: Type[Dataclass],
+) -> tuple[tuple[str, Any, bool, bool], ...]:
+    """
+    Resolve the fields of a dataclass once per dataclass.
+
+    :param dataclass: The dataclass type.
+    :type dataclass: Type[Dataclass]
+    :return: Tuple of field name, resolved type hint, and whether the section
+        and the conversion of the field can be ignored, for each field.
+    :rtype: tuple[tuple[str, Any, bool, bool], ...]
+    """
+    type_hints = get_type_hints(dataclass)
+    return tuple(
+        (
+            field.name,
+            type_hints[field.name],
+            _can_ignore_section(field),
+            _can_ignore_conversion(field),
+        )
+        for field in dataclasses.fields(dataclass)
+    )
+
+
+class _SectionsView(_MappingABC):
+    """
+    Read-only mapping of section names, including the default section, to
+    dictionaries of their options, built when a section is looked up.
+
+    Equivalent to the result of :meth:`ConfigConverter._to_dict`, without
+    copying sections that are never looked up.
+
+    :param converter: The converter whose configuration is viewed.
+    :type converter: ConfigConverter
+    """
+
+    def __init__(self, converter: ConfigConverter) -> None:
+        self._converter = converter
+        self._config = converter.config
+        self._default_section = converter.config.default_section
+
+    def __getitem__(self, section: str) -> dict[str, str]:
+        if section not in self:
+            raise KeyError(section)
+        return self._converter._section_to_dict(section)
+
+    def __contains__(self, section: object) -> bool:
+        return section == self._default_section or (
+            isinstance(section, str) and self._config.has_section(section)
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._config.sections()
+        yield self._default_section
+
+    def __len__(self) -> int:
+        return len(self._config.sections()) + 1
+
+
 class ConfigConverter:
     """
     A utility class for converting configuration data from a `ConfigParser`
@@ -130,6 +208,9 @@ class ConfigConverter:
         else:
             self.boolean_states = self.config.BOOLEAN_STATES
 
+        # Casting functions per type hint, see _cast_value
+        self._casters: dict[Any, Callable[[Any, int], Any]] = {}
+
     def to_dataclass(self, dataclass: Type[Dataclass]) -> Dataclass:
         """
         Convert the configuration data to a dataclass instance.
@@ -162,15 +243,16 @@ class ConfigConverter:
             >>> config_as_dataclass = converter.to_dataclass(ExampleConfig)
             >>> assert config_as_dataclass.section1.key == "value" # True
         """
+        config = self.config
+        default_section = config.default_section
         for sect in dataclasses.fields(dataclass):
-            if sect.name != self.config.default_section and not self.config.has_section(
-                sect.name
-            ):
-                self.config.add_section(sect.name)
+            if sect.name != default_section and not config.has_section(sect.name):
+                config.add_section(sect.name)
 
-        config_dict = self._to_dict()
+        # Sections are only copied into dictionaries as the dataclass fields
+        # look them up
         return self._dict_to_dataclass(
-            input_dict=config_dict,
+            input_dict=_SectionsView(self),
             dataclass=dataclass,
         )
 
@@ -197,38 +279,48 @@ class ConfigConverter:
             >>> config_dict['section1']['key1']
             'value1'
         """
-        config_dict: dict[str, dict[str, str]] = {}
-        for sect in self.config.sections():
-            # Add nested sections
-            config_dict[sect] = {}
-            for opt in self.config.options(sect):
-                config_dict[sect][opt] = self.config.get(section=sect, option=opt)
-        # Add default nested section
-        config_dict[self.config.default_section] = {}
-        for opt in self.config.defaults():
-            config_dict[self.config.default_section][opt] = self.config.get(
-                section=self.config.default_section, option=opt
-            )
-        return config_dict
+        return dict(_SectionsView(self))
+
+    def _section_to_dict(self, section: str) -> dict[str, str]:
+        """
+        Convert the options of a section, or the default section, to a
+        dictionary.
+
+        :param section: The section name.
+        :type section: str
+        :return: The options of the section and their values.
+        :rtype: dict[str, str]
+        """
+        config = self.config
+        if section == config.default_section:
+            options: Iterable[str] = config.defaults()
+        else:
+            options = config.options(section)
+        return {opt: config.get(section=section, option=opt) for opt in options}
 
     def _dict_to_dataclass(
         self,
-        input_dict: dict,
+        input_dict: Mapping[str, Any],
         dataclass: Type[Dataclass],
         nested_level: int = 0,
     ) -> Dataclass:
-        type_hints = get_type_hints(dataclass)
-
         _dict_with_types: dict[str, Any] = {}
-        for field in dataclasses.fields(dataclass):
-            field_name = field.name
-            field_type = type_hints[field_name]
-            logger.debug(f"Initiate conversion of {field_name=} and {field_type=}")
+        for (
+            field_name,
+            field_type,
+            can_ignore_section,
+            can_ignore_conversion,
+        ) in _resolved_fields(dataclass):
+            logger.debug(
+                "Initiate conversion of field_name=%r and field_type=%r",
+                field_name,
+                field_type,
+            )
 
             # Skip convertion of specified sections
             if nested_level == 0 and not self._parse_section(field_name):
-                if _can_ignore_section(field):
-                    logger.debug(f"Ignore conversion of section {field_name}")
+                if can_ignore_section:
+                    logger.debug("Ignore conversion of section %s", field_name)
                     continue
                 else:
                     raise ConversionIgnoreError(
@@ -237,13 +329,17 @@ class ConfigConverter:
 
             # Create dict with field names and casted values
             if field_name in input_dict:
-                logger.debug(f"Initiate type cast of {field_name=} to {field_type=}")
+                logger.debug(
+                    "Initiate type cast of field_name=%r to field_type=%r",
+                    field_name,
+                    field_type,
+                )
                 _dict_with_types[field_name] = self._cast_value(
                     value=input_dict[field_name],
                     type_hint=field_type,
                     nested_level=nested_level,
                 )
-            elif not _can_ignore_conversion(field):
+            elif not can_ignore_conversion:
                 raise ConversionIgnoreError(
                     f"Config not found and not allowed to skip {field_name=}, the field is not optional nor have a default or default_factory assignment."
                 )
@@ -260,44 +356,148 @@ class ConfigConverter:
         return not (is_not_included or is_excluded)
 
     def _cast_value(self, value: Any, type_hint: Any, nested_level: int = 0) -> Any:
+        if type(value) is type_hint and type_hint in _ATOMIC_TYPES:
+            return value
+        return self._get_caster(type_hint)(value, nested_level)
+
+    def _get_caster(self, type_hint: Any) -> Callable[[Any, int], Any]:
+        """
+        Get the function that casts a value into the given type hint.
+
+        :param type_hint: The type hint to cast values into.
+        :type type_hint: Any
+        :return: Function taking the value and the nesting level of the
+            dataclass it belongs to, returning the cast value.
+        :rtype: Callable[[Any, int], Any]
+        :raises ValueError: If the type hint is not supported.
+        """
+        # The type hints of a schema are a small fixed set, so the casting
+        # function is built once per type hint. Unions that only differ in
+        # member order compare equal, also when nested in other type hints, so
+        # anything but a plain class is keyed on its order sensitive repr too
+        key = type_hint if type(type_hint) is type else (type_hint, repr(type_hint))
+        try:
+            caster = self._casters[key]
+        except KeyError:
+            caster = self._casters[key] = self._build_caster(type_hint)
+        except TypeError:
+            # Unhashable type hint, e.g. a dataclass instance
+            caster = self._build_caster(type_hint)
+        return caster
+
+    def _cast_items(self, items: Iterable[Any], typ: Any) -> Iterator[Any]:
+        """
+        Lazily cast every item of a collection into the same type.
+
+        :param items: The items to cast, must not be empty.
+        :type items: Iterable[Any]
+        :param typ: The type to cast every item into.
+        :type typ: Any
+        :return: Iterator of the cast items.
+        :rtype: Iterator[Any]
+        """
+        if typ in _SCALAR_TYPES:
+            # Homogeneous scalars, map the type itself over the items
+            return map(typ, items)
+        # Resolve the element caster once and map it, rather than
+        # dispatching through _cast_value for every item
+        return map(self._get_caster(typ), items, repeat(0))
+
+    def _build_caster(self, type_hint: Any) -> Callable[[Any, int], Any]:
+        """
+        Build the function that casts a value into the given type hint.
+
+        :param type_hint: The type hint to cast values into.
+        :type type_hint: Any
+        :return: Function taking the value and the nesting level of the
+            dataclass it belongs to, returning the cast value.
+        :rtype: Callable[[Any, int], Any]
+        :raises ValueError: If the type hint is not supported.
+        """
         if dataclasses.is_dataclass(type_hint):
-            logger.debug("Type hint is a Dataclass")
             _type_hint = type_hint if isinstance(type_hint, type) else type(type_hint)
-            return self._dict_to_dataclass(
-                input_dict=value, dataclass=_type_hint, nested_level=nested_level + 1
-            )
+
+            def _cast_dataclass(value: Any, nested_level: int) -> Any:
+                logger.debug("Type hint is a Dataclass")
+                return self._dict_to_dataclass(
+                    input_dict=value,
+                    dataclass=_type_hint,
+                    nested_level=nested_level + 1,
+                )
+
+            return _cast_dataclass
         if type_hint is Any:
-            return value
-        if type_hint in [int, float, complex, str, Path, SecretStr]:
-            return type_hint(value)
+            return lambda value, _: value
+        if type_hint in _SCALAR_TYPES:
+            return lambda value, _: type_hint(value)
         if type_hint is bytes:
-            return str(value).encode()
+            return lambda value, _: str(value).encode()
         if type_hint is SecretBytes:
-            return SecretBytes(str(value).encode())
+            return lambda value, _: SecretBytes(str(value).encode())
         if type_hint is bool:
-            return self._cast_bool(value)
+            return lambda value, _: self._cast_bool(value)
         _origin = get_origin(type_hint)
-        if _origin in [list, List]:
-            return self._cast_list(value, type_hint)
-        if _origin in [dict, Dict]:
-            return self._cast_dict(value, type_hint)
-        if _origin in [set, Set]:
-            return self._cast_set(value, type_hint)
-        if _origin in [tuple, Tuple]:
-            return self._cast_tuple(value, type_hint)
-        if _origin in (Optional, Union, UnionType):
-            return self._cast_union(value, type_hint)
+        if _origin in _LIST_ORIGINS:
+            return lambda value, _: self._cast_list(value, type_hint)
+        if _origin in _DICT_ORIGINS:
+            return lambda value, _: self._cast_dict(value, type_hint)
+        if _origin in _SET_ORIGINS:
+            return lambda value, _: self._cast_set(value, type_hint)
+        if _origin in _TUPLE_ORIGINS:
+            return lambda value, _: self._cast_tuple(value, type_hint)
+        if _origin in _UNION_ORIGINS:
+            return lambda value, _: self._cast_union(value, type_hint)
         if type_hint is type(None):
-            return None
+            return lambda value, _: None
         if self.allow_custom_types:
-            return type_hint(value)
+            return lambda value, _: type_hint(value)
         raise ValueError(f"Unsupported type: {type_hint}")
 
+    def _fails_to_cast(self, value: Any, typ: Any) -> bool:
+        """
+        Cheaply tell whether casting a value into a type is certain to fail,
+        without raising and catching the error.
+
+        Only covers union members that commonly fail for config values, a
+        `False` result does not mean the cast succeeds.
+
+        :param value: The value to cast.
+        :type value: Any
+        :param typ: The type to cast into.
+        :type typ: Any
+        :return: True if the cast is certain to fail.
+        :rtype: bool
+        """
+        if typ is bool:
+            return self._boolean_state(value) is None
+        if typ is int and isinstance(value, str):
+            # int() needs at least one (unicode) decimal digit
+            return not any(char.isdigit() for char in value)
+        return False
+
+    def _boolean_state(self, value: Any) -> Optional[bool]:
+        """
+        Look up the boolean state of a value, case-insensitively.
+
+        :param value: The value to look up.
+        :type value: Any
+        :return: The boolean state, or `None` if the value is not a state.
+        :rtype: Optional[bool]
+        """
+        key = value if type(value) is str else str(value)
+        # Checking the case does not allocate, config values usually already
+        # are lowercase
+        if not key.islower():
+            key = key.lower()
+        return self.boolean_states.get(key)
+
     def _cast_bool(self, value: Any) -> bool:
-        if str(value).lower() in self.boolean_states:
-            return self.boolean_states[str(value).lower()]
-        else:
+        # Single lowercase conversion and lookup, this runs for every element
+        # of bool collections
+        state = self._boolean_state(value)
+        if state is None:
             raise ValueError(f"{value=} not in possible {self.boolean_states=}")
+        return state
 
     def _cast_list(self, value: Any, type_hint: Any) -> list:
         _evaluated_option = ast.literal_eval(value) if isinstance(value, str) else value
@@ -305,9 +505,13 @@ class ConfigConverter:
             _types = get_args(type_hint)
             for typ in _types:
                 try:
-                    return [self._cast_value(item, typ) for item in _evaluated_option]
+                    if not _evaluated_option:
+                        return []
+                    return list(self._cast_items(_evaluated_option, typ))
                 except Exception as e:
-                    logger.debug(f"Failed to cast {value=} into {typ=}, error: {e}")
+                    logger.debug(
+                        "Failed to cast value=%r into typ=%r, error: %s", value, typ, e
+                    )
                     continue
             raise ConversionError(
                 f"Not possible to cast {value} into a list of {_types}"
@@ -322,9 +526,13 @@ class ConfigConverter:
             _types = get_args(type_hint)
             for typ in _types:
                 try:
-                    return {self._cast_value(item, typ) for item in _evaluated_option}
+                    if not _evaluated_option:
+                        return set()
+                    return set(self._cast_items(_evaluated_option, typ))
                 except Exception as e:
-                    logger.debug(f"Failed to cast {value=} into {typ=}, error: {e}")
+                    logger.debug(
+                        "Failed to cast value=%r into typ=%r, error: %s", value, typ, e
+                    )
                     continue
             raise ConversionError(
                 f"Not possible to cast {value} into a set of {_types}"
@@ -339,11 +547,13 @@ class ConfigConverter:
             _types = get_args(type_hint)
             for typ in _types:
                 try:
-                    return tuple(
-                        self._cast_value(item, typ) for item in _evaluated_option
-                    )
+                    if not _evaluated_option:
+                        return ()
+                    return tuple(self._cast_items(_evaluated_option, typ))
                 except Exception as e:
-                    logger.debug(f"Failed to cast {value=} into {typ=}, error: {e}")
+                    logger.debug(
+                        "Failed to cast value=%r into typ=%r, error: %s", value, typ, e
+                    )
                     continue
             raise ConversionError(
                 f"Not possible to cast {value} into a tuple of {_types}"
@@ -357,13 +567,21 @@ class ConfigConverter:
         if isinstance(_evaluated_option, dict):
             k_typ, v_typ = get_args(type_hint)
             try:
+                if not _evaluated_option:
+                    return {}
+                cast_key = self._get_caster(k_typ)
+                cast_value = self._get_caster(v_typ)
                 return {
-                    self._cast_value(k, k_typ): self._cast_value(v, v_typ)
+                    cast_key(k, 0): cast_value(v, 0)
                     for k, v in _evaluated_option.items()
                 }
             except Exception as e:
                 logger.debug(
-                    f"Failed to cast {value=} into {k_typ=}, {v_typ=}, error: {e}"
+                    "Failed to cast value=%r into k_typ=%r, v_typ=%r, error: %s",
+                    value,
+                    k_typ,
+                    v_typ,
+                    e,
                 )
                 raise ConversionError(
                     f"Not possible to cast {value} into a dict of keys of type {k_typ}, and values of type {v_typ}, Error: {e}"
@@ -374,9 +592,14 @@ class ConfigConverter:
 
     def _cast_union(self, value: Any, type_hint: Any) -> Any:
         for typ in get_args(type_hint):
+            if self._fails_to_cast(value, typ):
+                logger.debug("Skip cast of value=%r into typ=%r", value, typ)
+                continue
             try:
                 return self._cast_value(value, typ)
             except Exception as e:
-                logger.debug(f"Failed to cast {value=} into {typ=}, error: {e}")
+                logger.debug(
+                    "Failed to cast value=%r into typ=%r, error: %s", value, typ, e
+                )
                 continue
         raise ConversionError(f"Not possible to cast {value} into type {type_hint}")
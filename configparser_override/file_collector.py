@@ -2,25 +2,28 @@ import logging
 import os
 import platform
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from configparser_override.exceptions import NoConfigFilesFoundError
 
 logger = logging.getLogger(__name__)
 
 
-def _log_and_return_if_exists(file_path: Path) -> Optional[Path]:
+def _log_and_return_if_exists(file_path: Union[str, Path]) -> Optional[Path]:
     """
     Check if the given file path exists and log as found if so.
 
+    Candidate paths are joined as strings, only the found ones are turned into
+    `Path` objects.
+
     :param file_path: Path to the configuration file.
-    :type file_path: Path
+    :type file_path: Union[str, Path]
     :return: The file path if it exists, otherwise None.
     :rtype: Optional[Path]
     """
-    if file_path.exists():
-        logger.debug(f"Found config file: {file_path}")
-        return file_path
+    if os.path.exists(file_path):
+        logger.debug("Found config file: %s", file_path)
+        return Path(file_path)
     return None
 
 
@@ -35,9 +38,10 @@ def _unix_collect_home_config(subdir: str, file_name: str) -> Optional[Path]:
     :return: Path to the home configuration file if it exists, otherwise None.
     :rtype: Optional[Path]
     """
-    home = Path.home()
-    xdg_config_home = Path(os.getenv("XDG_CONFIG_HOME", home / ".config"))
-    home_config = xdg_config_home / subdir / file_name
+    xdg_config_home = os.getenv("XDG_CONFIG_HOME")
+    if xdg_config_home is None:
+        xdg_config_home = os.path.join(Path.home(), ".config")
+    home_config = os.path.join(xdg_config_home, subdir, file_name)
     return _log_and_return_if_exists(home_config)
 
 
@@ -58,19 +62,22 @@ def _unix_collect_system_config(
     """
     config_file_list = []
     if bare_etc:
-        file_path = Path("/etc") / subdir / file_name
+        file_path = os.path.join("/etc", subdir, file_name)
         config_file = _log_and_return_if_exists(file_path)
         return [config_file] if config_file else []
 
-    xdg_config_dirs = [
-        Path(dir) for dir in os.getenv("XDG_CONFIG_DIRS", "/etc/xdg").split(":")
-    ]
-    for dir in xdg_config_dirs:
-        file_path = dir / subdir / file_name
+    xdg_config_dirs = os.getenv("XDG_CONFIG_DIRS")
+    # The first directory is the most important, walk them in reverse to
+    # return the files in ascending priority
+    for dir in (
+        reversed(xdg_config_dirs.split(":"))
+        if xdg_config_dirs is not None
+        else ("/etc/xdg",)
+    ):
+        file_path = os.path.join(dir, subdir, file_name)
         config_file = _log_and_return_if_exists(file_path)
         if config_file:
             config_file_list.append(config_file)
-    config_file_list.reverse()
     return config_file_list
 
 
@@ -87,7 +94,7 @@ def _windows_collect_home_config(subdir: str, file_name: str) -> Optional[Path]:
     """
     appdata = os.getenv("APPDATA")
     if appdata:
-        home_config = Path(appdata) / subdir / file_name
+        home_config = os.path.join(appdata, subdir, file_name)
         return _log_and_return_if_exists(home_config)
     return None
 
@@ -106,7 +113,7 @@ def _windows_collect_system_config(subdir: str, file_name: str) -> List[Path]:
     programdata = os.getenv("PROGRAMDATA")
     config_file_list = []
     if programdata:
-        file_path = Path(programdata) / subdir / file_name
+        file_path = os.path.join(programdata, subdir, file_name)
         config_file = _log_and_return_if_exists(file_path)
         if config_file:
             config_file_list.append(config_file)
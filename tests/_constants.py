@@ -1 +1,9 @@
 TEST_ENV_PREFIX = "TEST_"
+
+CONFIG_WITH_DEFAULT = """
+[DEFAULT]
+default_key = default_value
+
+[SECTION1]
+key1 = value1
+"""
@@ -2,30 +2,32 @@ import os
 
 import pytest
 
-from tests._constants import TEST_ENV_PREFIX
+from tests._constants import CONFIG_WITH_DEFAULT, TEST_ENV_PREFIX
 
+_TEST_ENV_PREFIX_LEN = len(TEST_ENV_PREFIX)
 
-@pytest.fixture(autouse=True)
+
+@pytest.fixture(autouse=True, scope="session")
 def clear_env():
-    # Clear environment variables before and after each test
-    keys_to_clear = [
-        key
-        for key in os.environ
-        if key.startswith(TEST_ENV_PREFIX) or key == "DEFAULT_KEY"
-    ]
-
-    for key in keys_to_clear:
+    # Tests set environment variables with monkeypatch, which restores them
+    # after each test. Only variables inherited from the outer environment
+    # are cleared, once for the session, and restored when it ends
+    saved_env = {
+        key: value
+        for key, value in os.environ.items()
+        if key[:_TEST_ENV_PREFIX_LEN] == TEST_ENV_PREFIX or key == "DEFAULT_KEY"
+    }
+
+    for key in saved_env:
         del os.environ[key]
 
     yield
 
-    for key in keys_to_clear:
-        if key in os.environ:
-            del os.environ[key]
+    os.environ.update(saved_env)
 
 
-@pytest.fixture
-def config_file(tmp_path):
+@pytest.fixture(scope="session")
+def config_file(tmp_path_factory):
     config_content = """
     [SECTION1]
     key1 = value1
@@ -34,27 +36,20 @@ def config_file(tmp_path):
     [SECTION2]
     key3 = value3
     """
-    config_path = tmp_path / "config.ini"
+    config_path = tmp_path_factory.mktemp("cfg") / "config.ini"
     config_path.write_text(config_content)
     return str(config_path)
 
 
-@pytest.fixture
-def config_file_with_default(tmp_path):
-    config_content = """
-    [DEFAULT]
-    default_key = default_value
-
-    [SECTION1]
-    key1 = value1
-    """
-    config_path = tmp_path / "config_with_default.ini"
-    config_path.write_text(config_content)
+@pytest.fixture(scope="session")
+def config_file_with_default(tmp_path_factory):
+    config_path = tmp_path_factory.mktemp("cfg") / "config_with_default.ini"
+    config_path.write_text(CONFIG_WITH_DEFAULT)
     return str(config_path)
 
 
-@pytest.fixture
-def config_file_with_custom_default(tmp_path):
+@pytest.fixture(scope="session")
+def config_file_with_custom_default(tmp_path_factory):
     config_content = """
     [COMMON]
     default_key1 = default_value1
@@ -68,6 +63,6 @@ def config_file_with_custom_default(tmp_path):
     [SECTION2]
     key3 = value3
     """
-    config_path = tmp_path / "config_with_custom_default.ini"
+    config_path = tmp_path_factory.mktemp("cfg") / "config_with_custom_default.ini"
     config_path.write_text(config_content)
     return str(config_path)
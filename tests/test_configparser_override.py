@@ -5,9 +5,13 @@ from io import StringIO
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 import configparser_override.file_collector
 from configparser_override import ConfigParserOverride, __version__
-from tests._constants import TEST_ENV_PREFIX
+from tests._constants import CONFIG_WITH_DEFAULT, TEST_ENV_PREFIX
+
+_PLATFORM = platform.system()
 
 
 def test_initialization():
@@ -41,11 +45,11 @@ def test_env_override_with_prefix(monkeypatch, config_file):
     assert config["SECTION2"]["key3"] == "override3"
 
 
-def test_default_section_override_with_env(monkeypatch, config_file_with_default):
+def test_default_section_override_with_env(monkeypatch):
     monkeypatch.setenv(f"{TEST_ENV_PREFIX}DEFAULT_KEY", "override_default")
 
     parser = ConfigParserOverride(env_prefix=TEST_ENV_PREFIX)
-    parser.read(filenames=config_file_with_default)
+    parser.read_string(CONFIG_WITH_DEFAULT)
     parser.apply_overrides()
     config = parser.config
 
@@ -56,32 +60,63 @@ def test_version_exists():
     assert isinstance(__version__, str)
 
 
-def test_direct_override_takes_precedence_over_env(monkeypatch, config_file):
-    monkeypatch.setenv(f"{TEST_ENV_PREFIX}SECTION1__KEY1", "env_override_value1")
-
-    parser = ConfigParserOverride(
-        env_prefix=TEST_ENV_PREFIX, SECTION1__key1="direct_override_value1"
-    )
-    parser.read(filenames=config_file)
-    parser.apply_overrides()
-    config = parser.config
-
-    assert config["SECTION1"]["key1"] == "direct_override_value1"
-    assert config["SECTION1"]["key2"] == "value2"  # Not overridden
-    assert config["SECTION2"]["key3"] == "value3"  # Not overridden
-
+@pytest.mark.parametrize(
+    "env, overrides, expected_key1, expected_key3",
+    [
+        pytest.param(
+            {"SECTION1__KEY1": "env_override_value1"},
+            {"SECTION1__key1": "direct_override_value1"},
+            "direct_override_value1",
+            "value3",
+            id="takes_precedence_over_env",
+        ),
+        pytest.param(
+            {},
+            {"SECTION1__key1": "direct_override_value1"},
+            "direct_override_value1",
+            "value3",
+            id="from_file",
+        ),
+        pytest.param(
+            {},
+            {"SECTION1__KEY1": "direct_override_value1"},
+            "direct_override_value1",
+            "value3",
+            id="case_insensitive_upper",
+        ),
+        pytest.param(
+            {},
+            {"section1__KEY1": "direct_override_value1"},
+            "direct_override_value1",
+            "value3",
+            id="case_insensitive_lower",
+        ),
+        pytest.param(
+            {},
+            {
+                "section1__KEY1": "direct_override_value1",
+                "section2__KEY3": "direct_override_value3",
+            },
+            "direct_override_value1",
+            "direct_override_value3",
+            id="case_insensitive_lower_multi",
+        ),
+    ],
+)
+def test_direct_override(
+    monkeypatch, config_file, env, overrides, expected_key1, expected_key3
+):
+    for key, value in env.items():
+        monkeypatch.setenv(f"{TEST_ENV_PREFIX}{key}", value)
 
-def test_direct_override_from_file(config_file):
-    parser = ConfigParserOverride(
-        env_prefix=TEST_ENV_PREFIX, SECTION1__key1="direct_override_value1"
-    )
+    parser = ConfigParserOverride(env_prefix=TEST_ENV_PREFIX, **overrides)
     parser.read(filenames=config_file)
     parser.apply_overrides()
     config = parser.config
 
-    assert config["SECTION1"]["key1"] == "direct_override_value1"
+    assert config["SECTION1"]["key1"] == expected_key1
     assert config["SECTION1"]["key2"] == "value2"  # Not overridden
-    assert config["SECTION2"]["key3"] == "value3"  # Not overridden
+    assert config["SECTION2"]["key3"] == expected_key3
 
 
 def test_combined_env_and_direct_override(monkeypatch, config_file):
@@ -99,11 +134,11 @@ def test_combined_env_and_direct_override(monkeypatch, config_file):
     assert config["SECTION2"]["key3"] == "value3"  # Not overridden
 
 
-def test_direct_override_in_default_section(config_file_with_default):
+def test_direct_override_in_default_section():
     parser = ConfigParserOverride(
         env_prefix=TEST_ENV_PREFIX, default_key="direct_override_default_value"
     )
-    parser.read(filenames=config_file_with_default)
+    parser.read_string(CONFIG_WITH_DEFAULT)
     parser.apply_overrides()
     config = parser.config
 
@@ -170,47 +205,6 @@ def test_case_insensitive_only_option_env_override(monkeypatch, config_file):
     assert config["SECTION2"]["key3"] == "value3"  # Not overridden
 
 
-def test_case_insensitive_upper_direct_override(config_file):
-    parser = ConfigParserOverride(
-        env_prefix=TEST_ENV_PREFIX, SECTION1__KEY1="direct_override_value1"
-    )
-    parser.read(filenames=config_file)
-    parser.apply_overrides()
-    config = parser.config
-
-    assert config["SECTION1"]["key1"] == "direct_override_value1"
-    assert config["SECTION1"]["key2"] == "value2"  # Not overridden
-    assert config["SECTION2"]["key3"] == "value3"  # Not overridden
-
-
-def test_case_insensitive_lower_direct_override(config_file):
-    parser = ConfigParserOverride(
-        env_prefix=TEST_ENV_PREFIX, section1__KEY1="direct_override_value1"
-    )
-    parser.read(filenames=config_file)
-    parser.apply_overrides()
-    config = parser.config
-
-    assert config["SECTION1"]["key1"] == "direct_override_value1"
-    assert config["SECTION1"]["key2"] == "value2"  # Not overridden
-    assert config["SECTION2"]["key3"] == "value3"  # Not overridden
-
-
-def test_case_insensitive_lower_direct_multi_override(config_file):
-    parser = ConfigParserOverride(
-        env_prefix=TEST_ENV_PREFIX,
-        section1__KEY1="direct_override_value1",
-        section2__KEY3="direct_override_value3",
-    )
-    parser.read(filenames=config_file)
-    parser.apply_overrides()
-    config = parser.config
-
-    assert config["SECTION1"]["key1"] == "direct_override_value1"
-    assert config["SECTION1"]["key2"] == "value2"  # Not overridden
-    assert config["SECTION2"]["key3"] == "direct_override_value3"
-
-
 def test_case_insensitive_lower_direct_not_new(config_file):
     parser = ConfigParserOverride(
         env_prefix=TEST_ENV_PREFIX,
@@ -260,7 +254,7 @@ def test_combined_case_sensitive_overrides(monkeypatch, config_file):
     parser.apply_overrides()
     config = parser.config
 
-    p = platform.system()
+    p = _PLATFORM
     if p == "Windows":
         assert config["SECTION1"]["key1"] == "direct_override_value1"
         assert config["SECTION1"]["key2"] == "env_override_value2"
@@ -287,7 +281,7 @@ def test_combined_case_sensitive_overrides_no_new(monkeypatch, config_file):
     parser.apply_overrides()
     config = parser.config
 
-    p = platform.system()
+    p = _PLATFORM
     if p == "Windows":
         assert config["SECTION1"]["key1"] == "direct_override_value1"
         assert config["SECTION1"]["key2"] == "env_override_value2"
@@ -303,12 +297,12 @@ def test_combined_case_sensitive_overrides_no_new(monkeypatch, config_file):
         assert not config.has_option("SECTIONNONE", "KEY1")
 
 
-def test_combined_overrides_with_default_section(monkeypatch, config_file_with_default):
+def test_combined_overrides_with_default_section(monkeypatch):
     monkeypatch.setenv(f"{TEST_ENV_PREFIX}DEFAULT_KEY", "env_override_default_value")
     parser = ConfigParserOverride(
         env_prefix=TEST_ENV_PREFIX, default_key="direct_override_default_value"
     )
-    parser.read(filenames=config_file_with_default)
+    parser.read_string(CONFIG_WITH_DEFAULT)
     parser.apply_overrides()
     config = parser.config
 
@@ -513,21 +507,24 @@ def test_combined_case_sensitive_overrides_plus_prefix(monkeypatch, config_file)
     assert config["SECTION2"]["key3"] == "value3"  # Not overridden
 
 
-def test_config_to_dataclass(config_file):
-    @dataclass
-    class Section1:
-        key1: str
-        key2: str
+@dataclass
+class Section1:
+    key1: str
+    key2: str
 
-    @dataclass
-    class Section2:
-        key3: str
 
-    @dataclass
-    class ConfigFile:
-        SECTION1: Section1
-        SECTION2: Section2
+@dataclass
+class Section2:
+    key3: str
 
+
+@dataclass
+class ConfigFile:
+    SECTION1: Section1
+    SECTION2: Section2
+
+
+def test_config_to_dataclass(config_file):
     parser = ConfigParserOverride()
     parser.read(filenames=config_file)
     parser.apply_overrides()
@@ -704,3 +701,67 @@ def test_read_file_with_overrides():
     assert config["section1"]["key1"] == "override_value1"
     assert config["section1"]["key2"] == "value2"
     assert config["section2"]["key3"] == "override_value3"
+
+
+def test_apply_overrides_twice_after_changed_overrides():
+    parser = ConfigParserOverride(section1__key1="override_value1")
+    parser.read_dict({"section1": {"key1": "value1", "key2": "value2"}})
+    parser.apply_overrides()
+
+    parser.overrides["section1__key2"] = "override_value2"
+    parser.apply_overrides()
+
+    config = parser.config
+    assert config["section1"]["key1"] == "override_value1"
+    assert config["section1"]["key2"] == "override_value2"
+
+
+def test_apply_overrides_twice_after_changed_env(monkeypatch):
+    parser = ConfigParserOverride(env_prefix=TEST_ENV_PREFIX)
+    parser.read_dict({"section1": {"key1": "value1"}})
+    parser.apply_overrides()
+
+    monkeypatch.setenv(f"{TEST_ENV_PREFIX}SECTION1__KEY1", "env_override_value1")
+    monkeypatch.setenv(f"{TEST_ENV_PREFIX}SECTION1__KEY2", "env_override_value2")
+    parser.apply_overrides()
+
+    config = parser.config
+    assert config["section1"]["key1"] == "env_override_value1"
+    assert config["section1"]["key2"] == "env_override_value2"
+
+
+def test_apply_overrides_without_overrides_or_prefix(monkeypatch):
+    monkeypatch.setenv(f"{TEST_ENV_PREFIX}SECTION1__KEY1", "env_override_value1")
+
+    parser = ConfigParserOverride()
+    parser.read_dict({f"{TEST_ENV_PREFIX}SECTION1": {"key1": "value1"}})
+    with patch(
+        "configparser_override.configparser_override._build_strategy"
+    ) as mock_build_strategy:
+        parser.apply_overrides()
+    config = parser.config
+
+    mock_build_strategy.assert_not_called()
+    assert config[f"{TEST_ENV_PREFIX}SECTION1"]["key1"] == "value1"
+
+
+def test_apply_overrides_without_prefix_no_new_builds_strategy():
+    parser = ConfigParserOverride(create_new_from_env_prefix=False)
+    with patch(
+        "configparser_override.configparser_override._build_strategy"
+    ) as mock_build_strategy:
+        parser.apply_overrides()
+
+    mock_build_strategy.assert_called_once()
+    mock_build_strategy.return_value.execute.assert_called_once_with()
+
+
+def test_env_override_without_prefix_no_new(monkeypatch):
+    monkeypatch.setenv(f"{TEST_ENV_PREFIX}SECTION1__KEY1", "env_override_value1")
+
+    parser = ConfigParserOverride(create_new_from_env_prefix=False)
+    parser.read_dict({f"{TEST_ENV_PREFIX}SECTION1": {"key1": "value1"}})
+    parser.apply_overrides()
+    config = parser.config
+
+    assert config[f"{TEST_ENV_PREFIX}SECTION1"]["key1"] == "env_override_value1"
@@ -2,7 +2,7 @@ import configparser
 import platform
 from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Any, Callable, Optional, get_type_hints
+from typing import Any, Callable, Optional, Union, get_type_hints
 
 import pytest
 
@@ -14,6 +14,8 @@ from configparser_override.convert import (
     _field_has_default_value,
     _is_optional_dataclass,
     _is_optional_type,
+    _resolved_fields,
+    _SectionsView,
 )
 from configparser_override.exceptions import (
     ConversionError,
@@ -23,10 +25,7 @@ from configparser_override.exceptions import (
 )
 from configparser_override.types import SecretBytes, SecretStr
 
-
-@pytest.fixture()
-def config_file_simple_types(tmp_path):
-    config_content = """
+CONFIG_SIMPLE_TYPES = """
     [DEFAULT]
     allkey = string
 
@@ -37,9 +36,6 @@ def config_file_simple_types(tmp_path):
     [section2]
     key3 = 1.2
     """
-    config_path = tmp_path / "config.ini"
-    config_path.write_text(config_content)
-    return str(config_path)
 
 
 @dataclass
@@ -67,9 +63,7 @@ class ConfigFileSimpleTypes:
     section2: Section2
 
 
-@pytest.fixture()
-def config_file_complex_types(tmp_path):
-    config_content = """
+CONFIG_COMPLEX_TYPES = """
     [DEFAULT]
     allkey = byte
     optionalallkey = 123
@@ -81,9 +75,6 @@ def config_file_complex_types(tmp_path):
     [section2]
     key3 = [1.2,1.4]
     """
-    config_path = tmp_path / "config.ini"
-    config_path.write_text(config_content)
-    return str(config_path)
 
 
 @dataclass
@@ -115,9 +106,7 @@ class ConfigFileComlexTypes:
     section2: ComplexSection2
 
 
-@pytest.fixture()
-def config_file_complex_types_nested(tmp_path):
-    config_content = """
+CONFIG_COMPLEX_TYPES_NESTED = """
     [DEFAULT]
     allkey = byte
     optionalallkey = 123
@@ -134,9 +123,6 @@ def config_file_complex_types_nested(tmp_path):
     key5 = [{"string1"},{"string2"}]
     key6 = ({"123j"},{"4+2j"})
     """
-    config_path = tmp_path / "config.ini"
-    config_path.write_text(config_content)
-    return str(config_path)
 
 
 @dataclass
@@ -176,9 +162,9 @@ class ConfigFileComlexNestedTypes:
     section3: ComplexNestedSection3
 
 
-def test_simple_config_to_dataclass(config_file_simple_types):
+def test_simple_config_to_dataclass():
     parser = ConfigParserOverride()
-    parser.read(filenames=config_file_simple_types)
+    parser.read_string(CONFIG_SIMPLE_TYPES)
     parser.apply_overrides()
 
     dataclass_rep = ConfigConverter(parser.config).to_dataclass(ConfigFileSimpleTypes)
@@ -189,9 +175,9 @@ def test_simple_config_to_dataclass(config_file_simple_types):
     assert dataclass_rep.section2.key3 == 1.2
 
 
-def test_complex_config_to_dataclass(config_file_complex_types):
+def test_complex_config_to_dataclass():
     parser = ConfigParserOverride()
-    parser.read(filenames=config_file_complex_types)
+    parser.read_string(CONFIG_COMPLEX_TYPES)
     parser.apply_overrides()
 
     dataclass_rep = ConfigConverter(parser.config).to_dataclass(ConfigFileComlexTypes)
@@ -205,9 +191,9 @@ def test_complex_config_to_dataclass(config_file_complex_types):
     assert dataclass_rep.section2.key3 == [1.2, 1.4]
 
 
-def test_complex_nested_config_to_dataclass(config_file_complex_types_nested):
+def test_complex_nested_config_to_dataclass():
     parser = ConfigParserOverride()
-    parser.read(filenames=config_file_complex_types_nested)
+    parser.read_string(CONFIG_COMPLEX_TYPES_NESTED)
     parser.apply_overrides()
 
     dataclass_rep = ConfigConverter(parser.config).to_dataclass(
@@ -564,6 +550,54 @@ def test_list_member_conversion_error():
         ConfigConverter(parser.config).to_dataclass(C)
 
 
+def test_collections_of_non_scalar_members():
+    @dataclass
+    class Sect1:
+        key1: set[bool]
+        key2: list[bool]
+        key3: tuple[bytes, ...]
+
+    @dataclass
+    class C:
+        sect1: Sect1
+
+    parser = ConfigParserOverride(
+        sect1__key1='{"yes", "no"}', sect1__key2='["on"]', sect1__key3='("a",)'
+    )
+    parser.read(filenames=[])
+    parser.apply_overrides()
+
+    result = ConfigConverter(parser.config).to_dataclass(C)
+    assert result.sect1.key1 == {True, False}
+    assert result.sect1.key2 == [True]
+    assert result.sect1.key3 == (b"a",)
+
+
+def test_union_members_skipped_without_casting():
+    converter = ConfigConverter(configparser.ConfigParser())
+
+    assert converter._cast_value("abc", int | str) == "abc"
+    assert converter._cast_value("maybe", bool | str) == "maybe"
+    assert converter._cast_value("yes", bool | str) is True
+    assert converter._cast_value("\u0661\u0662", int | str) == 12
+    assert converter._cast_value(" 1_0 ", int | str) == 10
+    assert converter._cast_value(1, int | str) == 1
+    assert converter._fails_to_cast("abc", float) is False
+
+
+def test_empty_collections_of_unsupported_members():
+    class Unsupported:
+        pass
+
+    converter = ConfigConverter(configparser.ConfigParser())
+    assert converter._cast_value("[]", list[Unsupported]) == []
+    assert converter._cast_value("set()", set[Unsupported]) == set()
+    assert converter._cast_value("()", tuple[Unsupported]) == ()
+    assert converter._cast_value("{}", dict[str, Unsupported]) == {}
+    with pytest.raises(ConversionError):
+        converter._cast_value("[1]", list[Unsupported])
+
+
 def test_set_member_conversion_error():
     @dataclass
     class Sect1:
@@ -700,21 +734,16 @@ def test_tuple_member_literaleval_error():
         ConfigConverter(parser.config).to_dataclass(C)
 
 
-@pytest.fixture()
-def config_file_allow_empty(tmp_path):
-    config_content = """
+CONFIG_ALLOW_EMPTY = """
     [sectionv]
     key1 = 123
 
     [sectione]
     key3
     """
-    config_path = tmp_path / "config_allow_empty.ini"
-    config_path.write_text(config_content)
-    return str(config_path)
 
 
-def test_none_type(config_file_allow_empty):
+def test_none_type():
     @dataclass
     class SectionV:
         key1: int
@@ -731,7 +760,7 @@ def test_none_type(config_file_allow_empty):
     parser = ConfigParserOverride(
         config_parser=configparser.ConfigParser(allow_no_value=True)
     )
-    parser.read(filenames=[config_file_allow_empty])
+    parser.read_string(CONFIG_ALLOW_EMPTY)
     parser.apply_overrides()
 
     dataclass_rep = parser.to_dataclass(ConfigEmptyKey)
@@ -739,18 +768,13 @@ def test_none_type(config_file_allow_empty):
     assert dataclass_rep.sectionv.key1 == 123
 
 
-@pytest.fixture()
-def config_file_any(tmp_path):
-    config_content = """
+CONFIG_ANY = """
     [section]
     key1 = 123
     """
-    config_path = tmp_path / "config_any.ini"
-    config_path.write_text(config_content)
-    return str(config_path)
 
 
-def test_any_type(config_file_any):
+def test_any_type():
     @dataclass
     class Section:
         key1: Any
@@ -760,27 +784,22 @@ def test_any_type(config_file_any):
         section: Section
 
     parser = ConfigParserOverride(config_parser=configparser.ConfigParser())
-    parser.read(filenames=[config_file_any])
+    parser.read_string(CONFIG_ANY)
     parser.apply_overrides()
 
     dataclass_rep = parser.to_dataclass(ConfigAny)
     assert dataclass_rep.section.key1 == "123"
 
 
-@pytest.fixture()
-def config_file_path(tmp_path):
-    config_content = """
+CONFIG_PATH = """
     [section]
     key1 = relative/path
     key2 = /absolut/unix/path
     key3 = c:/absolut/windows/path
     """
-    config_path = tmp_path / "config_any.ini"
-    config_path.write_text(config_content)
-    return str(config_path)
 
 
-def test_path_type(config_file_path):
+def test_path_type():
     @dataclass
     class Section:
         key1: Path
@@ -792,7 +811,7 @@ def test_path_type(config_file_path):
         section: Section
 
     parser = ConfigParserOverride(config_parser=configparser.ConfigParser())
-    parser.read(filenames=[config_file_path])
+    parser.read_string(CONFIG_PATH)
     parser.apply_overrides()
 
     dataclass_rep = parser.to_dataclass(ConfigAny)
@@ -900,6 +919,99 @@ def test_field_has_default_value():
     assert _field_has_default_value(f2[0])
 
 
+def test_resolved_fields():
+    @dataclass
+    class Section:
+        key1: int
+        key2: Optional[str]
+        key3: str = "default"
+
+    assert _resolved_fields(Section) == (
+        ("key1", int, False, False),
+        ("key2", Optional[str], False, True),
+        ("key3", str, True, True),
+    )
+    assert _resolved_fields(Section) is _resolved_fields(Section)
+
+
+def test_cast_value_reuses_caster_per_type_hint():
+    converter = ConfigConverter(configparser.ConfigParser())
+    assert converter._cast_value("1", int) == 1
+    caster = converter._casters[int]
+    assert converter._cast_value("2", int) == 2
+    assert converter._casters[int] is caster
+
+
+def test_cast_value_returns_atomic_values_of_the_same_type():
+    converter = ConfigConverter(configparser.ConfigParser())
+    value = 12345678901234567890
+    assert converter._cast_value(value, int) is value
+    assert converter._casters == {}
+    assert converter._cast_value(True, int) == 1
+    assert converter._cast_value(b"a", bytes) == b"b'a'"
+
+
+def test_cast_value_unhashable_dataclass_instance_type_hint():
+    @dataclass
+    class Section:
+        key: str
+
+    converter = ConfigConverter(configparser.ConfigParser())
+    result = converter._cast_value({"key": "value"}, Section(key="unused"))
+    assert result == Section(key="value")
+    assert converter._casters == {}
+
+
+def test_cast_value_reuses_caster_per_union_member_order():
+    converter = ConfigConverter(configparser.ConfigParser())
+    assert converter._cast_value("1", Union[int, str]) == 1
+    assert converter._cast_value("1", Union[str, int]) == "1"
+    assert converter._cast_value("1", int | str) == 1
+    assert converter._cast_value("1", str | int) == "1"
+    assert converter._cast_value("[1]", list[Union[int, str]]) == [1]
+    assert converter._cast_value("[1]", list[Union[str, int]]) == ["1"]
+    assert converter._cast_value("2", Union[int, str]) == 2
+    assert converter._cast_value("2", Union[str, int]) == "2"
+
+
+def test_union_member_order_across_converters():
+    # Unions that only differ in member order compare equal, each converter
+    # must still try the members in the order of its own type hint
+    int_first = ConfigConverter(configparser.ConfigParser())
+    assert int_first._cast_value("1", Union[int, str]) == 1
+    str_first = ConfigConverter(configparser.ConfigParser())
+    assert str_first._cast_value("1", Union[str, int]) == "1"
+    assert str_first._cast_value("[1]", list[Union[str, int]]) == ["1"]
+
+
+def test_sections_view():
+    config = configparser.ConfigParser()
+    config.read_string(
+        """
+        [DEFAULT]
+        allkey = string
+
+        [section1]
+        key1 = 123
+        """
+    )
+    view = _SectionsView(ConfigConverter(config))
+
+    assert list(view) == ["section1", "DEFAULT"]
+    assert len(view) == 2
+    assert "section1" in view
+    assert "DEFAULT" in view
+    assert "section2" not in view
+    assert view["section1"] == {"key1": "123", "allkey": "string"}
+    assert view["DEFAULT"] == {"allkey": "string"}
+    with pytest.raises(KeyError):
+        view["section2"]
+    assert ConfigConverter(config)._to_dict() == {
+        "section1": {"key1": "123", "allkey": "string"},
+        "DEFAULT": {"allkey": "string"},
+    }
+
+
 def test_parse_section():
     config = configparser.ConfigParser()
     config.add_section("abc")
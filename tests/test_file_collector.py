@@ -1,5 +1,5 @@
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -21,16 +21,19 @@ def mock_logger():
         yield
 
 
-def test_log_and_return_if_exists_file_exists():
-    path = MagicMock(spec=Path)
-    path.exists.return_value = True
+@patch("configparser_override.file_collector.os.path.exists")
+def test_log_and_return_if_exists_file_exists(mock_path_exists):
+    mock_path_exists.return_value = True
+    path = Path("/etc/xdg/testapp/config.ini")
     assert _log_and_return_if_exists(path) == path
+    assert _log_and_return_if_exists(str(path)) == path
+    mock_path_exists.assert_called_with(str(path))
 
 
-def test_log_and_return_if_exists_file_does_not_exist():
-    path = MagicMock(spec=Path)
-    path.exists.return_value = False
-    assert _log_and_return_if_exists(path) is None
+@patch("configparser_override.file_collector.os.path.exists")
+def test_log_and_return_if_exists_file_does_not_exist(mock_path_exists):
+    mock_path_exists.return_value = False
+    assert _log_and_return_if_exists(Path("/etc/xdg/testapp/config.ini")) is None
 
 
 @patch("configparser_override.file_collector.Path.home")
@@ -51,8 +54,21 @@ def test_unix_collect_home_config(mock_getenv, mock_home):
         assert result == Path("/home/testuser/.config/testapp/config.ini")
 
 
+@patch("configparser_override.file_collector.Path.home")
+@patch("configparser_override.file_collector.os.getenv")
+@patch("configparser_override.file_collector.os.path.exists")
+def test_unix_collect_home_config_default_xdg_config_home(
+    mock_path_exists, mock_getenv, mock_home
+):
+    mock_home.return_value = Path("/home/testuser")
+    mock_getenv.return_value = None
+    mock_path_exists.return_value = True
+    result = _unix_collect_home_config("testapp", "config.ini")
+    assert result == Path("/home/testuser/.config/testapp/config.ini")
+
+
 @patch("configparser_override.file_collector.os.getenv")
-@patch("configparser_override.file_collector.Path.exists")
+@patch("configparser_override.file_collector.os.path.exists")
 def test_unix_collect_system_config(mock_path_exists, mock_os_getenv):
     mock_os_getenv.return_value = "/etc/xdg"
 
@@ -64,7 +80,19 @@ def test_unix_collect_system_config(mock_path_exists, mock_os_getenv):
 
 
 @patch("configparser_override.file_collector.os.getenv")
-@patch("configparser_override.file_collector.Path.exists")
+@patch("configparser_override.file_collector.os.path.exists")
+def test_unix_collect_system_config_default_xdg_config_dirs(
+    mock_path_exists, mock_os_getenv
+):
+    mock_os_getenv.return_value = None
+
+    mock_path_exists.return_value = True
+    result = _unix_collect_system_config("testapp", "config.ini")
+    assert result == [Path("/etc/xdg/testapp/config.ini")]
+
+
+@patch("configparser_override.file_collector.os.getenv")
+@patch("configparser_override.file_collector.os.path.exists")
 def test_unix_collect_system_multi_config(mock_path_exists, mock_os_getenv):
     # First value is most important
     mock_os_getenv.return_value = "/etc/xdg:/etc"
@@ -81,7 +109,7 @@ def test_unix_collect_system_multi_config(mock_path_exists, mock_os_getenv):
 
 
 @patch("configparser_override.file_collector.os.getenv")
-@patch("configparser_override.file_collector.Path.exists")
+@patch("configparser_override.file_collector.os.path.exists")
 def test_unix_collect_system_multi_config_not_exist(mock_path_exists, mock_os_getenv):
     # First value is most important
     mock_os_getenv.return_value = "/etc/xdg:/etc"
@@ -94,7 +122,7 @@ def test_unix_collect_system_multi_config_not_exist(mock_path_exists, mock_os_ge
     assert result == []
 
 
-@patch("configparser_override.file_collector.Path.exists")
+@patch("configparser_override.file_collector.os.path.exists")
 def test_unix_collect_system_bare_etc(mock_path_exists):
     mock_path_exists.return_value = True
     subdir = "testapp"
@@ -107,7 +135,7 @@ def test_unix_collect_system_bare_etc(mock_path_exists):
 
 
 @patch("configparser_override.file_collector.os.getenv")
-@patch("configparser_override.file_collector.Path.exists")
+@patch("configparser_override.file_collector.os.path.exists")
 def test_windows_collect_home_config(mock_path_exists, mock_os_getenv):
     mock_os_getenv.return_value = "C:/Users/testuser/AppData/Roaming"
     mock_path_exists.return_value = True
@@ -127,7 +155,7 @@ def test_windows_collect_home_config_not_exist(mock_os_getenv):
 
 
 @patch("configparser_override.file_collector.os.getenv")
-@patch("configparser_override.file_collector.Path.exists")
+@patch("configparser_override.file_collector.os.path.exists")
 def test_windows_collect_system_config(mock_path_exists, mock_os_getenv):
     mock_os_getenv.return_value = "C:/ProgramData"
     mock_path_exists.return_value = True
@@ -138,7 +166,7 @@ def test_windows_collect_system_config(mock_path_exists, mock_os_getenv):
 
 
 @patch("configparser_override.file_collector.os.getenv")
-@patch("configparser_override.file_collector.Path.exists")
+@patch("configparser_override.file_collector.os.path.exists")
 def test_windows_collect_system_config_not_exist_path(mock_path_exists, mock_os_getenv):
     mock_os_getenv.return_value = "C:/ProgramData"
     mock_path_exists.return_value = False
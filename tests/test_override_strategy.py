@@ -1,8 +1,7 @@
 import configparser
+import logging
 import platform
 
-import pytest
-
 from configparser_override._override_strategy import (
     NewOptionsFromDirectAndEnvStrategy,
     NewOptionsFromDirectStrategy,
@@ -10,7 +9,6 @@ from configparser_override._override_strategy import (
     NoNewOptionsStrategy,
     _lowercase_optionxform,
 )
-from configparser_override.exceptions import SectionNotFound
 from tests._constants import TEST_ENV_PREFIX
 
 
@@ -148,69 +146,234 @@ def test_parse_key_case_insensitive():
     assert option == "option"
 
 
-def test_decide_env_var_case_insensitive():
+def test_env_var_name_case_insensitive(monkeypatch):
     config = configparser.ConfigParser()
-    strategy = NoNewOptionsStrategy(config, "", {})
-    env_var = strategy.decide_env_var("", "SECTION", "OPTION")
-    assert env_var == "SECTION__OPTION"
+    config.read_dict({"DEFAULT": {"default": "value"}, "Section": {"option": "value"}})
+    monkeypatch.setenv(f"{TEST_ENV_PREFIX}SECTION__OPTION", "env_value")
+    monkeypatch.setenv(f"{TEST_ENV_PREFIX}DEFAULT", "env_default")
+    strategy = NoNewOptionsStrategy(config, TEST_ENV_PREFIX.lower(), {})
+    strategy.execute()
+
+    assert config.get("Section", "option") == "env_value"
+    assert config.defaults()["default"] == "env_default"
 
 
-def test_decide_env_var_case_sensitive():
+def test_env_var_name_case_sensitive(monkeypatch):
     config = configparser.ConfigParser()
-    strategy = NoNewOptionsStrategy(config, "", {}, case_sensitive_overrides=True)
-    env_var = strategy.decide_env_var("", "section", "OPTION")
-    assert env_var == "section__OPTION"
+    config.optionxform = str  # type: ignore
+    config.read_dict({"DEFAULT": {"Default": "value"}, "Section": {"Option": "value"}})
+    monkeypatch.setenv(f"{TEST_ENV_PREFIX}Section__Option", "env_value")
+    monkeypatch.setenv(f"{TEST_ENV_PREFIX}Default", "env_default")
+    strategy = NoNewOptionsStrategy(
+        config, TEST_ENV_PREFIX, {}, case_sensitive_overrides=True, optionxform_fn=str
+    )
+    strategy.execute()
+
+    assert config.get("Section", "Option") == "env_value"
+    assert config.defaults()["Default"] == "env_default"
+
+
+def test_collect_env_vars_with_prefix(monkeypatch):
+    monkeypatch.setenv("PREFIX_SECTION__OPTION", "value")
+    strategy = NoNewOptionsStrategy(configparser.ConfigParser(), "PREFIX_", {})
+    env_vars = strategy.collect_env_vars_with_prefix("PREFIX_")
+    assert env_vars == {"SECTION__OPTION": "value"}
 
 
-def test_decide_env_var_case_insensitive_prefix():
+def test_collect_env_vars_with_prefix_from_snapshot(monkeypatch):
+    monkeypatch.setenv("PREFIX_SECTION__OPTION", "live_value")
+    strategy = NoNewOptionsStrategy(configparser.ConfigParser(), "PREFIX_", {})
+    env_vars = strategy.collect_env_vars_with_prefix(
+        "PREFIX_", {"PREFIX_SECTION__OPTION": "snapshot_value", "OTHER": "value"}
+    )
+    assert env_vars == {"SECTION__OPTION": "snapshot_value"}
+
+
+def test_collect_env_vars_with_prefix_keeps_prefix_characters():
+    strategy = NoNewOptionsStrategy(configparser.ConfigParser(), "PREFIX_", {})
+    env_vars = strategy.collect_env_vars_with_prefix(
+        "PREFIX_", {"PREFIX_PREFIX__OPTION_": "value"}
+    )
+    assert env_vars == {"PREFIX__OPTION_": "value"}
+
+
+def test_override_env_lowercase_default_named_section(monkeypatch):
     config = configparser.ConfigParser()
-    strategy = NoNewOptionsStrategy(config, "PREFIX_", {})
-    env_var = strategy.decide_env_var("PREFIX_", "SECTION", "OPTION")
-    assert env_var == "PREFIX_SECTION__OPTION"
+    config.add_section("default")
+    config.set("default", "option1", "value1")
+
+    monkeypatch.setenv(f"{TEST_ENV_PREFIX}OPTION1", "env_value1")
+    strategy = NoNewOptionsStrategy(config, TEST_ENV_PREFIX, {})
+    strategy.execute()
+
+    assert config.get("default", "option1") == "env_value1"
 
 
-def test_decide_env_var_case_sensitive_prefix():
+def test_no_new_direct_override_of_inherited_default_option():
     config = configparser.ConfigParser()
-    strategy = NoNewOptionsStrategy(
-        config, "PREFIX_", {}, case_sensitive_overrides=True
+    config.set("DEFAULT", "option1", "default_value1")
+    config.add_section("SECTION1")
+
+    overrides = {"SECTION1__option1": "new_value1", "SECTION1__option2": "ignored"}
+    strategy = NoNewOptionsStrategy(config, "", overrides)
+    strategy.execute()
+
+    assert config.get("SECTION1", "option1") == "new_value1"
+    assert config.defaults()["option1"] == "default_value1"
+    assert not config.has_option("SECTION1", "option2")
+
+
+def test_no_new_env_override_of_inherited_default_option(monkeypatch):
+    config = configparser.ConfigParser()
+    config.set("DEFAULT", "option1", "default_value1")
+    config.add_section("SECTION1")
+
+    monkeypatch.setenv(f"{TEST_ENV_PREFIX}SECTION1__OPTION1", "env_value1")
+    strategy = NoNewOptionsStrategy(config, TEST_ENV_PREFIX, {})
+    strategy.execute()
+
+    assert config.get("SECTION1", "option1") == "env_value1"
+    assert config.defaults()["option1"] == "default_value1"
+
+
+def test_override_env_debug_logging(monkeypatch, caplog):
+    config = configparser.ConfigParser()
+    config.set("DEFAULT", "option0", "value0")
+    config.add_section("SECTION1")
+    config.set("SECTION1", "option1", "value1")
+    config.set("SECTION1", "option2", "value2")
+
+    monkeypatch.setenv(f"{TEST_ENV_PREFIX}SECTION1__OPTION1", "env_value1")
+    strategy = NoNewOptionsStrategy(config, TEST_ENV_PREFIX, {})
+    with caplog.at_level(logging.DEBUG, logger="configparser_override"):
+        strategy.execute()
+
+    assert (
+        f"Override section='SECTION1', option='option1' with {TEST_ENV_PREFIX}SECTION1__OPTION1"
+        in caplog.messages
     )
-    env_var = strategy.decide_env_var("PREFIX_", "section", "OPTION")
-    assert env_var == "PREFIX_section__OPTION"
+    assert len(caplog.messages) == 1
 
 
-def test_has_section_case_insensitive():
+def test_parse_key_default_section_and_nested_separator():
     config = configparser.ConfigParser()
-    config.add_section("section")
     strategy = NoNewOptionsStrategy(config, "", {})
-    assert strategy.has_section("section")
-    assert strategy.has_section("SECTION")
+    assert strategy.parse_key("OPTION") == ("DEFAULT", "option")
+    assert strategy.parse_key("SECTION__OPTION__SUFFIX") == (
+        "SECTION",
+        "option__suffix",
+    )
 
 
-def test_has_section_case_sensitive():
+def test_no_new_env_override_default_and_section_scoped_names(monkeypatch):
     config = configparser.ConfigParser()
-    config.add_section("SECTION")
-    strategy = NoNewOptionsStrategy(config, "", {}, case_sensitive_overrides=True)
-    assert strategy.has_section("SECTION")
-    assert not strategy.has_section("section")
+    config.set("DEFAULT", "option1", "default_value1")
+    config.add_section("SECTION1")
+    config.add_section("SECTION2")
 
+    monkeypatch.setenv(f"{TEST_ENV_PREFIX}OPTION1", "env_default_value1")
+    monkeypatch.setenv(f"{TEST_ENV_PREFIX}SECTION1__OPTION1", "env_section_value1")
+    strategy = NoNewOptionsStrategy(config, TEST_ENV_PREFIX, {})
+    strategy.execute()
 
-def test_get_existing_section_case_insensitive():
+    assert config.defaults()["option1"] == "env_default_value1"
+    assert config.get("SECTION1", "option1") == "env_section_value1"
+    assert config.get("SECTION2", "option1") == "env_default_value1"
+
+
+def test_no_new_env_override_section_option_shadowing_default(monkeypatch):
     config = configparser.ConfigParser()
-    config.add_section("section")
-    strategy = NoNewOptionsStrategy(config, "", {})
-    assert strategy.get_existing_section_case_insensitive("SECTION") == "section"
+    config.set("DEFAULT", "option1", "default_value1")
+    config.add_section("SECTION1")
+    config.set("SECTION1", "option1", "value1")
+
+    monkeypatch.setenv(f"{TEST_ENV_PREFIX}SECTION1__OPTION1", "env_value1")
+    strategy = NoNewOptionsStrategy(config, TEST_ENV_PREFIX, {})
+    strategy.execute()
+
+    assert config.get("SECTION1", "option1") == "env_value1"
+    assert config.defaults()["option1"] == "default_value1"
 
 
-def test_get_existing_section_case_sensitive():
+def test_no_new_env_override_ignores_unprefixed_env_vars(monkeypatch):
     config = configparser.ConfigParser()
+    config.add_section("SECTION1")
+    config.set("SECTION1", "option1", "value1")
+
+    monkeypatch.setenv("SECTION1__OPTION1", "unprefixed_value1")
+    strategy = NoNewOptionsStrategy(config, TEST_ENV_PREFIX, {})
+    strategy.execute()
+
+    assert config.get("SECTION1", "option1") == "value1"
+
+
+def test_new_direct_strategy_reuses_added_section_case_insensitive():
+    config = configparser.ConfigParser()
+
+    overrides = {"SECTION1__option1": "value1", "section1__option2": "value2"}
+    strategy = NewOptionsFromDirectStrategy(config, "", overrides)
+    strategy.execute()
+
+    assert config.sections() == ["section1"]
+    assert config.get("section1", "option1") == "value1"
+    assert config.get("section1", "option2") == "value2"
+
+
+def test_new_direct_strategy_same_option_in_other_case_last_wins():
+    config = configparser.ConfigParser(strict=True)
+
+    overrides = {"section1__OPTION1": "value1", "SECTION1__option1": "value2"}
+    strategy = NewOptionsFromDirectStrategy(config, "", overrides)
+    strategy.execute()
+
+    assert config.get("section1", "option1") == "value2"
+
+
+def test_no_new_strategy_direct_takes_precedence_over_env(monkeypatch, caplog):
+    config = configparser.ConfigParser()
+    config.set("DEFAULT", "option0", "value0")
+    config.add_section("Section1")
+    config.set("Section1", "option1", "value1")
+    config.set("Section1", "option2", "value2")
+
+    monkeypatch.setenv(f"{TEST_ENV_PREFIX}SECTION1__OPTION1", "env_value1")
+    monkeypatch.setenv(f"{TEST_ENV_PREFIX}SECTION1__OPTION2", "env_value2")
+    overrides = {
+        "section1__option1": "direct_value1",
+        "section1__option0": "direct_value0",
+        "section1__option3": "direct_value3",
+        "section2__option1": "direct_value1",
+    }
+    strategy = NoNewOptionsStrategy(config, TEST_ENV_PREFIX, overrides)
+    with caplog.at_level(logging.DEBUG, logger="configparser_override"):
+        strategy.execute()
+
+    assert config.get("Section1", "option1") == "direct_value1"
+    assert config.get("Section1", "option2") == "env_value2"
+    assert config.get("Section1", "option0") == "direct_value0"
+    assert config.defaults()["option0"] == "value0"
+    assert not config.has_option("Section1", "option3")
+    assert not config.has_section("section2")
+    assert (
+        "New direct assignment section='section1' option='option3' ignored"
+        in caplog.messages
+    )
+    assert (
+        "New direct assignment section='section2' option='option1' ignored"
+        in caplog.messages
+    )
+
+
+def test_new_direct_strategy_prefers_first_section_differing_by_case():
+    config = configparser.ConfigParser()
+    config.add_section("Section")
     config.add_section("SECTION")
-    strategy = NoNewOptionsStrategy(config, "", {})
-    with pytest.raises(SectionNotFound):
-        strategy.get_existing_section_case_insensitive("NOT_A_SECTION")
 
+    overrides = {"section__option": "value", "default__option": "default_value"}
+    strategy = NewOptionsFromDirectStrategy(config, "", overrides)
+    strategy.execute()
 
-def test_collect_env_vars_with_prefix(monkeypatch):
-    monkeypatch.setenv("PREFIX_SECTION__OPTION", "value")
-    strategy = NoNewOptionsStrategy(configparser.ConfigParser(), "PREFIX_", {})
-    env_vars = strategy.collect_env_vars_with_prefix("PREFIX_")
-    assert env_vars == {"SECTION__OPTION": "value"}
+    assert config.get("Section", "option") == "value"
+    # Only inherited from the default section, not set on the later section
+    assert config.get("SECTION", "option") == "default_value"
+    assert config.defaults()["option"] == "default_value"
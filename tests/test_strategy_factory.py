@@ -8,55 +8,54 @@ from configparser_override._override_strategy import (
     NewOptionsFromEnvStrategy,
     NoNewOptionsStrategy,
 )
-from configparser_override._strategy_factory import StrategyFactory
+from configparser_override._strategy_factory import _build_strategy
 from configparser_override.exceptions import OverrideStrategyNotImplementedError
 from tests._constants import TEST_ENV_PREFIX
 
 
-def test_strategy_factory_no_prefix_no_new():
+def test_build_strategy_no_prefix_no_new():
     config = configparser.ConfigParser()
-    factory = StrategyFactory(config, "", False, False, {})
-    strategy = factory.get_strategy()
+    strategy = _build_strategy(config, "", False, False, {})
     assert isinstance(strategy, NoNewOptionsStrategy)
 
 
-def test_strategy_factory_no_prefix_new_direct():
+def test_build_strategy_no_prefix_new_direct():
     config = configparser.ConfigParser()
-    factory = StrategyFactory(config, "", False, True, {})
-    strategy = factory.get_strategy()
+    strategy = _build_strategy(config, "", False, True, {})
     assert isinstance(strategy, NewOptionsFromDirectStrategy)
 
 
-def test_strategy_factory_prefix_no_new():
+def test_build_strategy_prefix_no_new():
     config = configparser.ConfigParser()
-    factory = StrategyFactory(config, TEST_ENV_PREFIX, False, False, {})
-    strategy = factory.get_strategy()
+    strategy = _build_strategy(config, TEST_ENV_PREFIX, False, False, {})
     assert isinstance(strategy, NoNewOptionsStrategy)
 
 
-def test_strategy_factory_prefix_new_direct():
+def test_build_strategy_prefix_new_direct():
     config = configparser.ConfigParser()
-    factory = StrategyFactory(config, TEST_ENV_PREFIX, False, True, {})
-    strategy = factory.get_strategy()
+    strategy = _build_strategy(config, TEST_ENV_PREFIX, False, True, {})
     assert isinstance(strategy, NewOptionsFromDirectStrategy)
 
 
-def test_strategy_factory_prefix_new_env():
+def test_build_strategy_prefix_new_env():
     config = configparser.ConfigParser()
-    factory = StrategyFactory(config, TEST_ENV_PREFIX, True, False, {})
-    strategy = factory.get_strategy()
+    strategy = _build_strategy(config, TEST_ENV_PREFIX, True, False, {})
     assert isinstance(strategy, NewOptionsFromEnvStrategy)
 
 
-def test_strategy_factory_prefix_new_env_new_direct():
+def test_build_strategy_prefix_new_env_new_direct():
     config = configparser.ConfigParser()
-    factory = StrategyFactory(config, TEST_ENV_PREFIX, True, True, {})
-    strategy = factory.get_strategy()
+    strategy = _build_strategy(config, TEST_ENV_PREFIX, True, True, {})
     assert isinstance(strategy, NewOptionsFromDirectAndEnvStrategy)
 
 
-def test_strategy_factory_raises_not_implemented_error():
+def test_build_strategy_raises_not_implemented_error():
     config = configparser.ConfigParser()
-    factory = StrategyFactory(config, "", True, "s", {})  # type: ignore
     with pytest.raises(OverrideStrategyNotImplementedError):
-        factory.get_strategy()
+        _build_strategy(config, "", True, "s", {})  # type: ignore
+
+
+def test_build_strategy_no_prefix_new_env():
+    config = configparser.ConfigParser()
+    strategy = _build_strategy(config, "", True, False, {})
+    assert isinstance(strategy, NewOptionsFromEnvStrategy)